@@ -0,0 +1,40 @@
+import hashlib
+import time
+
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+VALIDATED_TOKEN_CACHE_TIMEOUT = 5
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that caches validated tokens for a few seconds.
+    Repeat requests carrying the same token skip signature verification.
+    """
+
+    def get_validated_token(self, raw_token):
+        """
+        Return a validated token, reusing a recent validation of the same token.
+        
+        Args:
+            raw_token: The raw JWT bytes taken from the Authorization header.
+            
+        Returns:
+            Token: The validated token instance.
+            
+        Raises:
+            InvalidToken: If the token fails validation.
+        """
+        key = f'jwt:{hashlib.sha256(raw_token).hexdigest()}'
+        validated_token = cache.get(key)
+        if validated_token is not None:
+            return validated_token
+
+        validated_token = super().get_validated_token(raw_token)
+
+        # Never keep a token cached past its own expiry
+        remaining = int(validated_token['exp'] - time.time())
+        timeout = min(VALIDATED_TOKEN_CACHE_TIMEOUT, remaining)
+        if timeout > 0:
+            cache.set(key, validated_token, timeout)
+        return validated_token
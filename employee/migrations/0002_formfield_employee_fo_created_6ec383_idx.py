@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-14 19:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employee', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='formfield',
+            index=models.Index(fields=['created_by', 'order'], name='employee_fo_created_6ec383_idx'),
+        ),
+    ]
@@ -2,6 +2,9 @@ from django.db import models
 from django.contrib.auth.models import AbstractUser
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth.models import BaseUserManager
+from django.core.cache import cache
+
+FORM_FIELDS_CACHE_TIMEOUT = 60
 
 class CustomUserManager(BaseUserManager):
     def create_user(self, email, password=None, **extra_fields):
@@ -40,6 +43,20 @@ class CustomUser(AbstractUser):
     def __str__(self):
         return self.email
 
+class FormFieldManager(models.Manager):
+    def cache_key(self, user_id):
+        return f'formfields:{user_id}'
+
+    def cached_for_user(self, user):
+        return cache.get_or_set(
+            self.cache_key(user.pk),
+            lambda: list(self.filter(created_by=user).values('id', 'label', 'field_type', 'required')),
+            FORM_FIELDS_CACHE_TIMEOUT
+        )
+
+    def clear_cache(self, user_id):
+        cache.delete(self.cache_key(user_id))
+
 class FormField(models.Model):
     FIELD_TYPES = (
         ('text', 'Text'),
@@ -59,8 +76,11 @@ class FormField(models.Model):
     created_by = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = FormFieldManager()
+
     class Meta:
         ordering = ['order']
+        indexes = [models.Index(fields=['created_by', 'order'])]
 
     def __str__(self):
         return f"{self.label} ({self.field_type})"
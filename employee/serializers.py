@@ -3,6 +3,7 @@ from .models import CustomUser, FormField, Employee
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from rest_framework.validators import UniqueValidator
 from django.contrib.auth.password_validation import validate_password
+from django.db import transaction
 
 class MyTokenObtainPairSerializer(TokenObtainPairSerializer):
     """
@@ -79,14 +80,12 @@ class RegisterSerializer(serializers.ModelSerializer):
         Returns:
             CustomUser: The newly created user instance.
         """
-        user = CustomUser.objects.create(
+        return CustomUser.objects.create_user(
             email=validated_data['email'],
             first_name=validated_data['first_name'],
-            last_name=validated_data['last_name']
+            last_name=validated_data['last_name'],
+            password=validated_data['password']
         )
-        user.set_password(validated_data['password'])
-        user.save()
-        return user
 
 class ChangePasswordSerializer(serializers.Serializer):
     """
@@ -127,6 +126,8 @@ class UpdateUserSerializer(serializers.ModelSerializer):
             ValidationError: If email is already in use by another user.
         """
         user = self.context['request'].user
+        if value == user.email:
+            return value
         if CustomUser.objects.exclude(pk=user.pk).filter(email=value).exists():
             raise serializers.ValidationError({"email": "This email is already in use."})
         return value
@@ -154,6 +155,7 @@ class EmployeeSerializer(serializers.ModelSerializer):
         model = Employee
         fields = '__all__'
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         """
         Update employee instance including nested user data.
@@ -173,4 +175,30 @@ class EmployeeSerializer(serializers.ModelSerializer):
         
         instance.fields = validated_data.get('fields', instance.fields)
         instance.save()
-        return instance
\ No newline at end of file
+        return instance
+
+class EmployeeListSerializer(serializers.ModelSerializer):
+    """
+    Read-only serializer for listing employees.
+    Renders user fields directly from the joined user row instead of
+    running the nested user serializer for every employee.
+    """
+    
+    user = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Employee
+        fields = '__all__'
+
+    def get_user(self, obj):
+        """
+        Build the user representation from the employee's user.
+        
+        Args:
+            obj: Employee instance with its user already selected.
+            
+        Returns:
+            dict: The user fields exposed by UpdateUserSerializer.
+        """
+        user = obj.user
+        return {field: getattr(user, field) for field in UpdateUserSerializer.Meta.fields}
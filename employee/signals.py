@@ -0,0 +1,10 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import FormField
+
+
+@receiver([post_save, post_delete], sender=FormField)
+def clear_form_fields_cache(sender, instance, **kwargs):
+    """Drop the cached form field list of the user who owns the changed field."""
+    FormField.objects.clear_cache(instance.created_by_id)
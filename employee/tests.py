@@ -1,3 +1,170 @@
+import hashlib
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .authentication import CachedJWTAuthentication
+from .models import CustomUser, FormField
+
+
+class UpdateFieldOrderTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = CustomUser.objects.create_user(
+            email='owner@example.com', password='pass-1234', first_name='Owner', last_name='User'
+        )
+        self.other = CustomUser.objects.create_user(
+            email='other@example.com', password='pass-1234', first_name='Other', last_name='User'
+        )
+        self.name = FormField.objects.create(label='Name', field_type='text', order=0, created_by=self.user)
+        self.age = FormField.objects.create(label='Age', field_type='number', order=1, created_by=self.user)
+        self.foreign = FormField.objects.create(label='Phone', field_type='text', order=7, created_by=self.other)
+        self.client.force_login(self.user)
+
+    def post_order(self, order):
+        return self.client.post(
+            reverse('update_field_order'), {'order[]': order}, HTTP_X_REQUESTED_WITH='XMLHttpRequest'
+        )
+
+    def test_reorder_uses_single_update(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.post_order([self.age.id, self.name.id])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'status': 'success'})
+        updates = [q['sql'] for q in ctx.captured_queries if q['sql'].startswith('UPDATE "employee_formfield"')]
+        self.assertEqual(len(updates), 1)
+        self.age.refresh_from_db()
+        self.name.refresh_from_db()
+        self.assertEqual((self.age.order, self.name.order), (0, 1))
+
+    def test_non_integer_id_is_rejected(self):
+        response = self.post_order([self.age.id, 'abc'])
+
+        self.assertEqual(response.status_code, 400)
+        self.age.refresh_from_db()
+        self.assertEqual(self.age.order, 1)
+
+    def test_other_users_fields_are_untouched(self):
+        response = self.post_order([self.foreign.id, self.age.id, self.name.id])
+
+        self.assertEqual(response.status_code, 200)
+        self.foreign.refresh_from_db()
+        self.assertEqual(self.foreign.order, 7)
+        self.age.refresh_from_db()
+        self.assertEqual(self.age.order, 1)
+
+    def test_reorder_clears_cached_field_list(self):
+        FormField.objects.cached_for_user(self.user)
+        key = FormField.objects.cache_key(self.user.pk)
+        self.assertIsNotNone(cache.get(key))
+
+        self.post_order([self.age.id, self.name.id])
+
+        self.assertIsNone(cache.get(key))
+        labels = [field['label'] for field in FormField.objects.cached_for_user(self.user)]
+        self.assertEqual(labels, ['Age', 'Name'])
+
+    def test_request_without_ajax_header_is_rejected(self):
+        response = self.client.post(reverse('update_field_order'), {'order[]': [self.age.id]})
+
+        self.assertEqual(response.status_code, 400)
+
+
+class CachedJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = CustomUser.objects.create_user(
+            email='owner@example.com', password='pass-1234', first_name='Owner', last_name='User'
+        )
+        self.auth = CachedJWTAuthentication()
+
+    def raw_token(self, exp=None):
+        token = AccessToken.for_user(self.user)
+        if exp is not None:
+            token['exp'] = exp
+        return str(token).encode()
+
+    def cache_key(self, raw_token):
+        return f'jwt:{hashlib.sha256(raw_token).hexdigest()}'
+
+    def test_cache_hit_skips_validation(self):
+        raw_token = self.raw_token()
+        validated = AccessToken(raw_token)
+
+        with mock.patch.object(JWTAuthentication, 'get_validated_token', return_value=validated) as validate:
+            first = self.auth.get_validated_token(raw_token)
+            second = self.auth.get_validated_token(raw_token)
+
+        validate.assert_called_once_with(raw_token)
+        self.assertEqual(first.payload, validated.payload)
+        self.assertEqual(second.payload, validated.payload)
+
+    def test_timeout_is_capped_at_token_expiry(self):
+        exp = int(time.time()) + 60
+        raw_token = self.raw_token(exp=exp)
+
+        with mock.patch('employee.authentication.time') as clock, \
+                mock.patch('employee.authentication.cache.set') as cache_set:
+            clock.time.return_value = exp - 2.5
+            self.auth.get_validated_token(raw_token)
+
+        cache_set.assert_called_once()
+        self.assertEqual(cache_set.call_args.args[2], 2)
+
+    def test_token_about_to_expire_is_not_cached(self):
+        exp = int(time.time()) + 60
+        raw_token = self.raw_token(exp=exp)
+
+        with mock.patch('employee.authentication.time') as clock:
+            clock.time.return_value = exp - 0.5
+            self.auth.get_validated_token(raw_token)
+
+        self.assertIsNone(cache.get(self.cache_key(raw_token)))
+
+    def test_invalid_token_is_not_cached(self):
+        raw_token = self.raw_token()[:-2] + b'xx'
+
+        with self.assertRaises(InvalidToken):
+            self.auth.get_validated_token(raw_token)
+
+        self.assertIsNone(cache.get(self.cache_key(raw_token)))
+
+    def test_expired_token_is_rejected(self):
+        raw_token = self.raw_token(exp=int(time.time()) - 10)
+
+        with self.assertRaises(InvalidToken):
+            self.auth.get_validated_token(raw_token)
+
+        self.assertIsNone(cache.get(self.cache_key(raw_token)))
+
+
+class RegisterViewTests(TestCase):
+    def setUp(self):
+        CustomUser.objects.create_user(
+            email='owner@example.com', password='pass-1234', first_name='Owner', last_name='User'
+        )
+
+    def test_duplicate_email_is_rejected_before_hashing(self):
+        data = {
+            'email': 'owner@example.com',
+            'first_name': 'Owner',
+            'last_name': 'User',
+            'password': 'pass-5678',
+            'password2': 'pass-5678',
+        }
+
+        with mock.patch.object(CustomUser, 'set_password') as set_password:
+            response = self.client.post('/register/', data)
 
-# Create your tests here.
+        self.assertContains(response, 'Email already exists')
+        set_password.assert_not_called()
+        self.assertEqual(CustomUser.objects.filter(email='owner@example.com').count(), 1)
@@ -3,10 +3,12 @@ from rest_framework.response import Response
 from rest_framework import status, generics, permissions
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework_simplejwt.tokens import RefreshToken
-from django.shortcuts import render, redirect
+from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth import logout, login
 from django.contrib.auth.decorators import login_required
 from django.http import JsonResponse
+from django.db import IntegrityError, transaction
+from django.db.models import Case, When, IntegerField
 
 from .models import CustomUser, FormField, Employee
 from .serializers import (
@@ -15,7 +17,8 @@ from .serializers import (
     ChangePasswordSerializer,
     UpdateUserSerializer,
     FormFieldSerializer,
-    EmployeeSerializer
+    EmployeeSerializer,
+    EmployeeListSerializer
 )
 
 class MyTokenObtainPairView(TokenObtainPairView):
@@ -76,7 +79,7 @@ class ChangePasswordView(generics.UpdateAPIView):
                 return Response({"old_password": ["Wrong password."]}, status=status.HTTP_400_BAD_REQUEST)
             
             self.object.set_password(serializer.data.get("new_password"))
-            self.object.save()
+            self.object.save(update_fields=['password'])
             return Response({"status": "success"}, status=status.HTTP_200_OK)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -117,25 +120,27 @@ class FormFieldRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
 
 class EmployeeListCreateView(generics.ListCreateAPIView):
     """API view for listing and creating employees."""
-    queryset = Employee.objects.all()
+    queryset = Employee.objects.select_related('user')
     serializer_class = EmployeeSerializer
     permission_classes = [permissions.IsAuthenticated]
 
+    def get_queryset(self):
+        """Return only employees associated with the current user."""
+        return self.queryset.filter(user=self.request.user)
+
+    def get_serializer_class(self):
+        """Use the lightweight read-only serializer when listing employees."""
+        if self.request.method == 'GET':
+            return EmployeeListSerializer
+        return self.serializer_class
+
     def perform_create(self, serializer):
-        """
-        Create an employee and associate it with the current user.
-        Also ensures the user has an employee profile.
-        """
-        user = self.request.user
-        employee = serializer.save(user=user)
-        
-        # Create a corresponding CustomUser if needed
-        if not hasattr(user, 'employee'):
-            Employee.objects.create(user=user, fields={})
+        """Create an employee and associate it with the current user."""
+        serializer.save(user=self.request.user)
 
 class EmployeeRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
     """API view for retrieving, updating and deleting employees."""
-    queryset = Employee.objects.all()
+    queryset = Employee.objects.select_related('user')
     serializer_class = EmployeeSerializer
     permission_classes = [permissions.IsAuthenticated]
 
@@ -161,7 +166,7 @@ def login_view(request):
         if not email or not password:
             return render(request, 'login.html', {'error': 'Please enter both email and password.'})
 
-        user = CustomUser.objects.filter(email=email).first()
+        user = CustomUser.objects.only('id', 'email', 'password', 'is_active').filter(email=email).first()
 
         if user and user.check_password(password):
             login(request, user)
@@ -192,15 +197,20 @@ def register_view(request):
         if password != password2:
             return render(request, 'register.html', {'error': 'Passwords do not match'})
         
+        # Check first so duplicate signups skip the password hash
         if CustomUser.objects.filter(email=email).exists():
             return render(request, 'register.html', {'error': 'Email already exists'})
         
-        user = CustomUser.objects.create_user(
-            email=email,
-            first_name=first_name,
-            last_name=last_name,
-            password=password
-        )
+        try:
+            with transaction.atomic():
+                CustomUser.objects.create_user(
+                    email=email,
+                    first_name=first_name,
+                    last_name=last_name,
+                    password=password
+                )
+        except IntegrityError:
+            return render(request, 'register.html', {'error': 'Email already exists'})
         return render(request, 'login.html')
     return render(request, 'login.html')
 
@@ -241,7 +251,7 @@ def change_password_view(request):
             return render(request, 'change_password.html', {'error': 'Old password is incorrect'})
         
         request.user.set_password(new_password)
-        request.user.save()
+        request.user.save(update_fields=['password'])
         return redirect('login')
     
     return render(request, 'change_password.html')
@@ -299,15 +309,16 @@ def employee_create_view(request):
         HttpResponse: Rendered employee creation page or redirect to employee list on success.
     """
     if request.method == 'POST':
-        fields = {}
-        form_fields = FormField.objects.filter(created_by=request.user)
-        
-        for field in form_fields:
-            field_value = request.POST.get(f'field_{field.id}')
-            fields[field.label] = {
-                'value': field_value,
-                'type': field.field_type
+        # Read fresh rows: the cached list can lag behind edits made in another process
+        form_fields = FormField.objects.filter(created_by=request.user).values('id', 'label', 'field_type')
+        post = request.POST
+        fields = {
+            field['label']: {
+                'value': post.get(f"field_{field['id']}"),
+                'type': field['field_type']
             }
+            for field in form_fields
+        }
         
         Employee.objects.create(
             user=request.user,
@@ -315,7 +326,7 @@ def employee_create_view(request):
         )
         return redirect('employee_list')
     
-    form_fields = FormField.objects.filter(created_by=request.user)
+    form_fields = FormField.objects.cached_for_user(request.user)
     return render(request, 'employee_create.html', {'fields': form_fields})
 
 @login_required
@@ -330,15 +341,13 @@ def employee_list_view(request):
         HttpResponse: Rendered employee list page with search results.
     """
     employees = Employee.objects.filter(user=request.user)
-    form_fields = FormField.objects.filter(created_by=request.user)
     
     search_query = request.GET.get('search', '')
     if search_query:
         employees = employees.filter(fields__icontains=search_query)
     
     return render(request, 'employee_list.html', {
-        'employees': employees,
-        'fields': form_fields,
+        'employees': employees.values('id', 'user__email'),
         'search_query': search_query
     })
 
@@ -354,24 +363,25 @@ def employee_edit_view(request, pk):
     Returns:
         HttpResponse: Rendered employee edit page or redirect to employee list on success.
     """
-    employee = Employee.objects.get(pk=pk, user=request.user)
+    employee = get_object_or_404(Employee.objects.select_related('user'), pk=pk, user=request.user)
     
     if request.method == 'POST':
-        fields = {}
-        form_fields = FormField.objects.filter(created_by=request.user)
-        
-        for field in form_fields:
-            field_value = request.POST.get(f'field_{field.id}')
-            fields[field.label] = {
-                'value': field_value,
-                'type': field.field_type
+        # Read fresh rows: the cached list can lag behind edits made in another process
+        form_fields = FormField.objects.filter(created_by=request.user).values('id', 'label', 'field_type')
+        post = request.POST
+        fields = {
+            field['label']: {
+                'value': post.get(f"field_{field['id']}"),
+                'type': field['field_type']
             }
+            for field in form_fields
+        }
         
         employee.fields = fields
-        employee.save()
+        employee.save(update_fields=['fields', 'updated_at'])
         return redirect('employee_list')
     
-    form_fields = FormField.objects.filter(created_by=request.user)
+    form_fields = FormField.objects.cached_for_user(request.user)
     return render(request, 'employee_edit.html', {
         'employee': employee,
         'fields': form_fields
@@ -389,7 +399,7 @@ def employee_delete_view(request, pk):
     Returns:
         HttpResponseRedirect: Redirect to employee list.
     """
-    employee = Employee.objects.get(pk=pk, user=request.user)
+    employee = get_object_or_404(Employee, pk=pk, user=request.user)
     employee.delete()
     return redirect('employee_list')
 
@@ -404,9 +414,17 @@ def update_field_order(request):
     Returns:
         JsonResponse: Success or error status.
     """
-    if request.method == 'POST' and request.is_ajax():
-        order = request.POST.getlist('order[]')
-        for idx, field_id in enumerate(order):
-            FormField.objects.filter(id=field_id, created_by=request.user).update(order=idx)
+    if request.method == 'POST' and request.headers.get('x-requested-with') == 'XMLHttpRequest':
+        try:
+            ids = [int(field_id) for field_id in request.POST.getlist('order[]')]
+        except ValueError:
+            return JsonResponse({'status': 'error'}, status=400)
+
+        if ids:
+            whens = [When(id=field_id, then=idx) for idx, field_id in enumerate(ids)]
+            FormField.objects.filter(id__in=ids, created_by=request.user).update(
+                order=Case(*whens, output_field=IntegerField())
+            )
+            FormField.objects.clear_cache(request.user.pk)
         return JsonResponse({'status': 'success'})
     return JsonResponse({'status': 'error'}, status=400)
\ No newline at end of file